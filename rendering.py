@@ -80,12 +80,25 @@ class PSDFullRenderer(Renderer):
 
                 for i, layer in enumerate(reversed(self.psd.layers)):
                     if getattr(layer, 'visible', True):
+                        # Skip layers that cannot contribute before topil()
+                        # decodes their pixels
+                        if getattr(layer, 'opacity', 255) == 0:
+                            continue
+                        bbox = getattr(layer, 'bbox', None)
+                        if bbox is not None:
+                            left, top, right, bottom = bbox
+                            if (right <= left or bottom <= top or right <= 0 or bottom <= 0
+                                    or left >= width or top >= height):
+                                continue
                         try:
                             if callable(getattr(layer, 'topil', None)):
                                 layer_img = layer.topil()
                                 if layer_img:
+                                    # alpha_composite blends in C but needs RGBA on both sides
+                                    if layer_img.mode != 'RGBA':
+                                        layer_img = layer_img.convert('RGBA')
                                     composite.alpha_composite(layer_img, (layer.left, layer.top))
-                                    logger.debug(f"Layer {i} composited: {getattr(layer, 'name', 'unnamed')}")
+                                    logger.debug("Layer %d composited: %s", i, getattr(layer, 'name', 'unnamed'))
                         except Exception as e:
                             logger.warning(f"Layer {i} error ({getattr(layer, 'name', 'unnamed')}): {e}")
                 methods_tried.append("manual layer composition")
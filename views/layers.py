@@ -104,8 +104,16 @@ class LayerManagerView(BaseView):
         Args:
             layer_id: ID of the layer to activate.
         """
+        previous_id = self.active_layer_id
         self.active_layer_id = layer_id
-        self._update_layers_display()
+        if layer_id not in self._layer_buttons:
+            self._update_layers_display()
+            return
+            
+        # Only the two affected buttons change style; no need to rebuild
+        if previous_id in self._layer_buttons:
+            self._layer_buttons[previous_id].configure(style='TButton')
+        self._layer_buttons[layer_id].configure(style='Active.TButton')
     
     def _update_layers_display(self) -> None:
         """Update the display of layers."""
@@ -184,6 +192,5 @@ class LayerManagerView(BaseView):
         Args:
             layer_id: ID of the selected layer.
         """
-        self.active_layer_id = layer_id
-        self._update_layers_display()
+        self.set_active_layer(layer_id)
         self.trigger_callback('layer_selected', layer_id)
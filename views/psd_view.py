@@ -7,16 +7,26 @@ representation of PSD files, including layer management, zooming, and navigation
 from __future__ import annotations
 
 import os
+import math
 import logging
+import functools
 import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Dict, Any, Tuple, List, Union, Callable, TYPE_CHECKING
 from dataclasses import dataclass, field
 from enum import Enum
 
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, messagebox
+import PIL
 from PIL import Image, ImageTk, ImageDraw
 from psd_tools import PSDImage
+try:
+    from cykooz_resizer import CropBox, FilterType, ResizeAlg, ResizeOptions, Resizer
+except ImportError:
+    Resizer = None
 from psd_tools.api.layers import (
     Group,
     Layer,
@@ -38,6 +48,15 @@ psd_optimizer = PSDOptimizer(cache=True)
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Pillow-SIMD releases carry a ".postN" version suffix; its SIMD resize
+# kernels only cover 8-bit-per-channel modes such as RGB and RGBA
+PILLOW_SIMD = '.post' in PIL.__version__
+logger.debug("Pillow %s (SIMD build: %s)", PIL.__version__, PILLOW_SIMD)
+
+# cykooz.resizer (Rust fast_image_resize bindings) is optional; when it is
+# installed, 8-bit RGB/RGBA resamples use its SSE4.1/AVX2 kernels
+logger.debug("cykooz.resizer available: %s", Resizer is not None)
+
 class MessageType(Enum):
     """Types of status messages."""
     INFO = 'info'
@@ -46,6 +65,7 @@ class MessageType(Enum):
     ERROR = 'error'
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def from_string(cls, value: str) -> 'MessageType':
         """Convert a string to MessageType enum."""
         return cls(value.lower())
@@ -53,7 +73,37 @@ class MessageType(Enum):
     def __str__(self) -> str:
         return self.value
 
-# Zoom functionality has been removed
+@dataclass
+class ZoomSettings:
+    """Zoom-related settings."""
+    min_scale: float = 0.1  # 10%
+    max_scale: float = 10.0  # 1000%
+    steps_per_octave: int = 8  # Zoom in/out rungs between 1x and 2x
+    render_delay_ms: int = 16  # Coalescing window for scroll re-renders
+    zoom_debounce_ms: int = 30  # Quiet time after the last zoom step
+
+@dataclass
+class ScaledView:
+    """A display-ready image produced by the render worker.
+    
+    Attributes:
+        source: The composite the view was rendered from.
+        image: The pixels to show; the whole scaled image, or only the
+            visible part of it.
+        size: The (width, height) of the whole image at ``scale``.
+        origin: The offset of ``image`` within the whole image, or None if
+            the whole image was rendered.
+        scale: The display scale the image was rendered at.
+        canvas_wh: The canvas size the viewport was computed for.
+        scroll: The canvas scroll position the viewport was computed for.
+    """
+    source: Image.Image
+    image: Image.Image
+    size: Tuple[int, int]
+    origin: Optional[Tuple[int, int]]
+    scale: float
+    canvas_wh: Tuple[int, int]
+    scroll: Tuple[int, int]
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -94,6 +144,52 @@ class PSDView(BaseView):
     - Status updates and error handling
     """
     
+    # Status bar styling per message type
+    _STATUS_COLORS: Dict[MessageType, str] = {
+        MessageType.INFO: 'black',
+        MessageType.SUCCESS: '#006400',     # Dark green
+        MessageType.WARNING: '#8B4513',     # Saddle brown
+        MessageType.ERROR: '#8B0000'        # Dark red
+    }
+    _BOLD_STATUS_TYPES = frozenset({MessageType.WARNING, MessageType.ERROR})
+    _LOG_LEVELS: Dict[MessageType, int] = {
+        MessageType.INFO: logging.INFO,
+        MessageType.SUCCESS: logging.INFO,
+        MessageType.WARNING: logging.WARNING,
+        MessageType.ERROR: logging.ERROR
+    }
+    
+    # Wheel direction of the X11 scroll buttons, which carry no delta
+    _WHEEL_BUTTONS: Dict[int, int] = {4: 1, 5: -1}
+    
+    # Modes ImageTk.PhotoImage.paste hands to Tk without converting
+    _TK_NATIVE_MODES: Tuple[str, ...] = ('1', 'L', 'RGB', 'RGBA')
+    
+    # Filter for the residual resize after integer reduction; BILINEAR is
+    # SIMD-accelerated under Pillow-SIMD and visually close to LANCZOS here
+    RESAMPLE_FILTER = Image.BILINEAR
+    
+    # Downscales by more than this factor box-reduce by an integer factor
+    # first, so the filter runs on a much smaller intermediate
+    REDUCING_GAP = 3.0
+    
+    # Scaled display images kept per composite, keyed by zoom percent
+    SCALE_CACHE_SIZE = 8
+    
+    # Mipmap levels are halved until the short side reaches this size
+    PYRAMID_MIN_SIZE = 128
+    
+    # The shared PhotoImage is reallocated once its area exceeds the image
+    # being shown by more than this factor
+    PHOTO_SLACK_FACTOR = 4
+    
+    # cykooz.resizer filter matching RESAMPLE_FILTER
+    _CYKOOZ_FILTER = 'bilinear'
+    
+    # Re-renders of a cached composite smaller than this finish before a
+    # loading indicator would be seen
+    LOADING_INDICATOR_MIN_PIXELS = 2_000_000
+    
     def __init__(self, parent: tk.Widget, **kwargs) -> None:
         """Initialize the PSD view with enhanced memory management.
         
@@ -103,13 +199,53 @@ class PSDView(BaseView):
         """
         # Initialize instance variables with type hints
         self.psd_doc: Optional[PSDDocument] = None
-        self.current_scale: float = 1.0  # Fixed scale at 100%
+        self._zoom_settings = ZoomSettings()
+        self.current_scale: float = 1.0
+        self._zoom_after_id: Optional[str] = None
+        # Image point kept in place by a pending zoom, as fractions of the
+        # image size, and the window position it stays under
+        self._zoom_anchor: Optional[Tuple[float, float, int, int]] = None
         
         # Image and canvas references
         self._photo_image: Optional[ImageTk.PhotoImage] = None
+        self._pi_capacity: Tuple[int, int] = (0, 0)
+        self._pi_shown: Tuple[int, int] = (0, 0)
+        self._pi_mode: Optional[str] = None
+        self._blit: Optional[Callable[[Image.Image], None]] = None
+        self._img_wh: Tuple[int, int] = (0, 0)
+        self._view_origin: Optional[Tuple[int, int]] = None
+        self._view_after_id: Optional[str] = None
+        self._current_composite_scale: Optional[float] = None
+        self._canvas_wh: Tuple[int, int] = (0, 0)
+        self._cfg_pending: bool = False
+        # A render waiting for the canvas size to become known
+        self._render_deferred: bool = False
+        self._last_scrollregion: Optional[Tuple[int, int, int, int]] = None
+        # Inputs of the last _apply_layout: canvas size, image size,
+        # viewport origin and canvas item
+        self._last_layout: Optional[Tuple[Any, ...]] = None
         self._current_image: Optional[Image.Image] = None
+        # True while the renderer is generating the composite of a new load
+        self._composite_pending: bool = False
+        self._prepared: Optional[Tuple[Image.Image, Image.Image]] = None
+        self._scale_source: Optional[Image.Image] = None
+        self._scale_cache: OrderedDict[int, Image.Image] = OrderedDict()
+        self._pyramid: List[Image.Image] = []
+        # Viewport image handed back after its blit, for the next render;
+        # deque pop/append are atomic, so the worker and Tk thread can share it
+        self._scratch: deque = deque(maxlen=1)
+        self._resizer = Resizer() if Resizer is not None else None
+        self._resize_alg = (ResizeAlg.convolution(FilterType[self._CYKOOZ_FILTER])
+                            if Resizer is not None else None)
         self.image_on_canvas: Optional[int] = None
         
+        # Background compositing; results are handed back via ``after``
+        self._render_pool: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
+        self._pending_future: Optional[Future] = None
+        # The scale the pending render was requested at
+        self._pending_scale: Optional[float] = None
+        self._render_generation: int = 0
+        
         # Layer management
         self.layer_widgets: Dict[str, Any] = {}
         self.show_hidden_layers: bool = False
@@ -117,6 +253,10 @@ class PSDView(BaseView):
         # Status bar
         self._status_timer: Optional[str] = None
         self._status_message_id: Optional[int] = None
+        self._last_status_style: Optional[Tuple[str, Any]] = None
+        self._last_status: Optional[Tuple[str, MessageType]] = None
+        self._font_normal: Optional[tkfont.Font] = None
+        self._font_bold: Optional[tkfont.Font] = None
         
         # UI components
         self.main_paned: Optional[ttk.PanedWindow] = None
@@ -128,6 +268,8 @@ class PSDView(BaseView):
         self.status_var: Optional[tk.StringVar] = None
         self.status_bar: Optional[ttk.Label] = None
         self.context_menu: Optional[tk.Menu] = None
+        self._menu_indices: List[int] = []
+        self._last_menu_state: Optional[str] = None
         
         # Track mouse state for panning
         self._pan_start_x: int = 0
@@ -182,51 +324,61 @@ class PSDView(BaseView):
             will not raise exceptions if resources have already been cleaned up.
         """
         try:
+            # Stop any background render before tearing down widgets
+            if self._render_pool is not None:
+                self._cancel_render()
+                self._render_pool.shutdown(wait=False)
+            
+            # Drop any zoom render that has not run yet
+            if self._zoom_after_id is not None:
+                self.after_cancel(self._zoom_after_id)
+                self._zoom_after_id = None
+            if self._view_after_id is not None:
+                self.after_cancel(self._view_after_id)
+                self._view_after_id = None
+            
             # Clean up image resources
-            if hasattr(self, '_photo_image') and self._photo_image:
-                self._photo_image = None
-            if hasattr(self, '_current_image') and self._current_image:
-                self._current_image = None
+            self._invalidate_composite()
             
             # Clean up canvas items
-            if hasattr(self, 'canvas') and self.canvas:
+            if self.canvas is not None:
                 self.canvas.delete(tk.ALL)
                 
             # Clean up scrollbars
-            if hasattr(self, 'h_scrollbar') and self.h_scrollbar:
+            if self.h_scrollbar is not None:
                 self.h_scrollbar.destroy()
-            if hasattr(self, 'v_scrollbar') and self.v_scrollbar:
+            if self.v_scrollbar is not None:
                 self.v_scrollbar.destroy()
                 
             # Clean up status bar
-            if hasattr(self, 'status_var') and self.status_var:
+            if self.status_var is not None:
                 self.status_var.set('')
-            if hasattr(self, 'status_bar') and self.status_bar:
+            if self.status_bar is not None:
                 self.status_bar.destroy()
                 
             # Clean up context menu
-            if hasattr(self, 'context_menu') and self.context_menu:
+            if self.context_menu is not None:
                 self.context_menu.destroy()
                 
             # Clean up layer widgets
-            if hasattr(self, 'layer_widgets') and self.layer_widgets:
+            if self.layer_widgets:
                 for widget in self.layer_widgets.values():
                     if isinstance(widget, tk.Widget):
                         widget.destroy()
                 self.layer_widgets.clear()
                 
-            # Clean up PSD document
-            if hasattr(self, 'psd_doc') and self.psd_doc:
-                # Clear references to prevent memory leaks
-                self.psd_doc = None
+            # Clear references to the PSD document to prevent memory leaks
+            self.psd_doc = None
                 
             # Clear PSD optimizer cache
-            if hasattr(self, 'psd_optimizer'):
-                self.psd_optimizer.clear_cache()
-                
+            self.psd_optimizer.clear_cache()
                 
             # Clear any remaining references
             self.image_on_canvas = None
+            self._current_composite_scale = None
+            self._last_scrollregion = None
+            self._last_layout = None
+            self._view_origin = None
             self.layer_widgets = {}
             self.main_paned = None
             self.info_view = None
@@ -244,8 +396,9 @@ class PSDView(BaseView):
 
     def _cleanup_photo_image(self) -> None:
         """Cleanup the PhotoImage reference to prevent memory leaks."""
-        if hasattr(self, '_photo_image') and self._photo_image:
-            self._photo_image = None
+        self._photo_image = None
+        self._pi_capacity = (0, 0)
+        self._pi_shown = (0, 0)
 
     def _bind_events(self):
         """Bind necessary events for the PSD view.
@@ -266,21 +419,50 @@ class PSDView(BaseView):
         # Canvas click events
         self.canvas.bind("<Button-1>", self._on_canvas_click)
         
+        # Mouse wheel scrolls, Ctrl + mouse wheel zooms (Linux reports the
+        # wheel as buttons 4 and 5)
+        self.canvas.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.canvas.bind("<Button-4>", self._on_mouse_wheel)
+        self.canvas.bind("<Button-5>", self._on_mouse_wheel)
+        self.canvas.bind("<Control-MouseWheel>", self._on_ctrl_mouse_wheel)
+        self.canvas.bind("<Control-Button-4>", self._on_ctrl_mouse_wheel)
+        self.canvas.bind("<Control-Button-5>", self._on_ctrl_mouse_wheel)
+        
+        # Track the canvas size so layout code never has to query Tk for it
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+        
         # Make sure the canvas has focus to receive keyboard events
         self.canvas.focus_set()
 
     def _on_canvas_configure(self, event: tk.Event) -> None:
         """Handle canvas resize event.
         
-        This method updates the canvas size and adjusts the scroll region accordingly.
+        This method caches the new canvas size and schedules a single
+        re-layout once Tk is idle, so a burst of resize events during a
+        window drag is handled only once.
         """
-        try:
-            if hasattr(self, 'canvas') and self.canvas:
-                self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-                self._update_scroll_region()
-        except Exception as e:
-            logger.exception("Error handling canvas configure event")
-            raise RuntimeError(f"Failed to handle canvas configure event: {str(e)}") from e
+        self._canvas_wh = (event.width, event.height)
+        if self._cfg_pending:
+            return
+        self._cfg_pending = True
+        self.after_idle(self._do_configure)
+    
+    def _do_configure(self) -> None:
+        """Re-center the image after the canvas has been resized."""
+        self._cfg_pending = False
+        if self.canvas is None:
+            return
+        if self._render_deferred:
+            self._render_deferred = False
+            self._rescale()
+            return
+        # <Configure> also fires when only the position changed
+        if self._last_layout is not None and self._last_layout[0] == self._canvas_wh:
+            return
+        if self._view_origin is not None:
+            self._render_view()
+        else:
+            self._center_image()
     
     def _on_mouse_press(self, event: tk.Event) -> None:
         """Handle mouse button press event for panning."""
@@ -304,6 +486,7 @@ class PSDView(BaseView):
             
             self._pan_start_x = event.x
             self._pan_start_y = event.y
+            self._schedule_view_render()
         except Exception as e:
             logger.error(f"Error during canvas panning: {str(e)}")
             self._show_status_message(f"Error: {str(e)}", MessageType.ERROR)
@@ -313,6 +496,57 @@ class PSDView(BaseView):
         self._is_panning = False
         self.canvas.config(cursor="")
     
+    def _on_mouse_wheel(self, event: tk.Event) -> str:
+        """Scroll vertically with the mouse wheel.
+        
+        Args:
+            event: The wheel event; ``delta`` on Windows/macOS, button 4 or
+                5 on Linux.
+                
+        Returns:
+            str: "break" to stop the default handling.
+        """
+        if self.canvas is None:
+            return "break"
+            
+        delta = self._wheel_delta(event)
+        if delta:
+            self.canvas.yview_scroll(-delta, "units")
+            self._schedule_view_render()
+        return "break"
+    
+    def _on_ctrl_mouse_wheel(self, event: tk.Event) -> str:
+        """Zoom with Ctrl + mouse wheel.
+        
+        Args:
+            event: The wheel event; ``delta`` on Windows/macOS, button 4 or
+                5 on Linux.
+            
+        Returns:
+            str: "break" to stop the default handling.
+        """
+        delta = self._wheel_delta(event)
+        if delta > 0:
+            self.zoom_in(anchor=(event.x, event.y))
+        elif delta < 0:
+            self.zoom_out(anchor=(event.x, event.y))
+        return "break"
+    
+    def _wheel_delta(self, event: tk.Event) -> int:
+        """Get the direction of a mouse-wheel event.
+        
+        Args:
+            event: A ``<MouseWheel>`` event, or a Linux button 4/5 press.
+            
+        Returns:
+            int: 1 for wheel up, -1 for wheel down, 0 if there is no motion.
+        """
+        # Check the button first: Tk reports "??" as the delta of a press
+        direction = self._WHEEL_BUTTONS.get(event.num)
+        if direction is not None:
+            return direction
+        return 1 if event.delta > 0 else -1 if event.delta < 0 else 0
+    
     def _setup_ui(self) -> None:
         """Set up the PSD view UI components.
         
@@ -370,6 +604,12 @@ class PSDView(BaseView):
                 padding=(5, 2, 5, 2)
             )
             self.status_bar.pack(side=tk.LEFT, fill=tk.X, expand=True)
+            self._last_status_style = None
+            self._last_status = None
+            
+            # Font objects keep their metrics cached in Tk across updates
+            self._font_normal = tkfont.Font(self, family='TkDefaultFont', size=9)
+            self._font_bold = tkfont.Font(self, family='TkDefaultFont', size=9, weight='bold')
             
             # Initialize with a default message
             self.show_status("Ready", MessageType.INFO)
@@ -437,22 +677,26 @@ class PSDView(BaseView):
     
     def _on_xscroll(self, *args) -> None:
         """Handle horizontal scrolling."""
-        if hasattr(self, 'canvas') and self.canvas:
+        if self.canvas is not None:
             self.canvas.xview(*args)
+            self._schedule_view_render()
     
     def _on_yscroll(self, *args) -> None:
         """Handle vertical scrolling."""
-        if hasattr(self, 'canvas') and self.canvas:
+        if self.canvas is not None:
             self.canvas.yview(*args)
+            self._schedule_view_render()
     
     def _setup_context_menu(self) -> None:
         """Set up the right-click context menu for the canvas."""
-        if not hasattr(self, 'canvas') or not self.canvas:
+        if self.canvas is None:
             return
             
         self.context_menu = tk.Menu(self.canvas, tearoff=0)
         self.context_menu.add_command(label="Reset View", command=self.reset_zoom)
         self.context_menu.add_command(label="Fit to Window", command=self.fit_to_window)
+        self._menu_indices = list(range(self.context_menu.index('end') + 1))
+        self._last_menu_state = None
         
         # Bind right-click to show context menu
         self.canvas.bind("<Button-3>", self._show_context_menu)
@@ -466,7 +710,7 @@ class PSDView(BaseView):
         Args:
             event: The mouse event that triggered the context menu.
         """
-        if not hasattr(self, 'context_menu'):
+        if self.context_menu is None:
             try:
                 # Create the context menu
                 self.context_menu = tk.Menu(self, tearoff=0)
@@ -477,22 +721,19 @@ class PSDView(BaseView):
                     command=self.fit_to_window,
                     accelerator="Ctrl+1"
                 )
-                
-                # Disable menu items if no document is loaded
-                if not hasattr(self, 'psd_doc') or not self.psd_doc:
-                    for i in range(self.context_menu.index('end') + 1):
-                        self.context_menu.entryconfigure(i, state='disabled')
+                self._menu_indices = list(range(self.context_menu.index('end') + 1))
+                self._last_menu_state = None
             except Exception as e:
                 logger.exception("Error creating context menu")
                 return
         
         try:
-            # Update menu item states based on current state
-            has_doc = hasattr(self, 'psd_doc') and self.psd_doc is not None
-            state = 'normal' if has_doc else 'disabled'
-            
-            for i in range(self.context_menu.index('end') + 1):
-                self.context_menu.entryconfigure(i, state=state)
+            # Update menu item states only when the document state changed
+            state = 'normal' if self.psd_doc is not None else 'disabled'
+            if state != self._last_menu_state:
+                for i in self._menu_indices:
+                    self.context_menu.entryconfigure(i, state=state)
+                self._last_menu_state = state
             
             # Show the menu at the click position
             self.context_menu.tk_popup(event.x_root, event.y_root)
@@ -518,7 +759,7 @@ class PSDView(BaseView):
             # Handle left click (button 1)
             if event.num == 1 or event.num == 1:  # Standard left click
                 # Hide context menu if visible
-                if hasattr(self, 'context_menu') and self.context_menu:
+                if self.context_menu is not None:
                     try:
                         self.context_menu.unpost()
                     except Exception as e:
@@ -539,18 +780,14 @@ class PSDView(BaseView):
         Args:
             composite: The composite image, or None if there was an error.
         """
+        self._composite_pending = False
         if composite is None:
             self.show_status("Failed to generate composite image", "error")
             return
             
         try:
             # Update the image display
-            self._current_image = composite
-            self._photo_image = ImageTk.PhotoImage(composite)
-            
-            # Update the canvas
-            self._update_canvas()
-            self._center_image()
+            self._show_composite(composite)
             
             # Update info view if available
             if hasattr(self, 'info_view') and self.info_view and hasattr(self, 'psd_doc'):
@@ -579,6 +816,7 @@ class PSDView(BaseView):
             
             # Reset view state
             self.current_scale = 1.0
+            self._invalidate_composite()
             
             # Clean up existing PSD document
             if hasattr(self, 'psd_doc') and self.psd_doc:
@@ -594,10 +832,7 @@ class PSDView(BaseView):
                 cached_preview = psd_cache.get_cached_image(filepath, "_preview")
                 if cached_preview:
                     try:
-                        self._current_image = cached_preview
-                        self._photo_image = ImageTk.PhotoImage(cached_preview)
-                        self._update_canvas()
-                        self._center_image()
+                        self._show_composite(cached_preview)
                         
                         # Load PSD in background for metadata
                         def load_psd_in_background():
@@ -627,10 +862,7 @@ class PSDView(BaseView):
                 # Try to get the composite from cache
                 cached_composite = psd_cache.get_cached_image(filepath, "_full")
                 if cached_composite:
-                    self._current_image = cached_composite
-                    self._photo_image = ImageTk.PhotoImage(cached_composite)
-                    self._update_canvas()
-                    self._center_image()
+                    self._show_composite(cached_composite)
                     
                     if hasattr(self, 'info_view') and self.info_view:
                         self.info_view.update_info(self.psd_doc)
@@ -648,11 +880,15 @@ class PSDView(BaseView):
                 if psd_obj is None:
                     raise ValueError("Could not access PSD data")
                 
-                logger.debug(f"Creating renderer for PSD: {filepath}")
+                logger.debug("Creating renderer for PSD: %s", filepath)
                 renderer = PSDFullRenderer(psd_obj, filepath)
                 
                 logger.debug("Requesting composite image...")
-                composite = renderer.get_composite_image(callback=self._on_composite_ready)
+                # The renderer invokes the callback from its loader thread, so
+                # hop back onto the Tk thread before touching any widgets
+                composite = renderer.get_composite_image(
+                    callback=lambda img: self.after(0, self._on_composite_ready, img)
+                )
                 
                 if composite is not None:
                     # Got composite synchronously
@@ -661,6 +897,7 @@ class PSDView(BaseView):
                 else:
                     # Composite will be loaded asynchronously
                     logger.debug("Composite will be loaded asynchronously")
+                    self._composite_pending = True
                     self._show_loading_indicator("Generating composite in background...")
                     
             except Exception as e:
@@ -699,19 +936,21 @@ class PSDView(BaseView):
         Args:
             message: The message to display in the loading indicator.
         """
-        if not hasattr(self, 'canvas') or not self.canvas:
+        if self.canvas is None:
             return
             
-        self.canvas.delete("all")
+        canvas_width, canvas_height = self._canvas_wh
+        self.canvas.delete("loading_text", "error_text")
         self.canvas.create_text(
-            self.canvas.winfo_width() // 2,
-            self.canvas.winfo_height() // 2,
+            canvas_width // 2,
+            canvas_height // 2,
             text=message,
             font=('Arial', 12),
             fill='gray',
             tags=("loading_text",)
         )
-        self.canvas.update()
+        # Draw the text without processing queued input events
+        self.canvas.update_idletasks()
 
     def _show_error_indicator(self, error_msg: str) -> None:
         """Display an error message on the canvas.
@@ -719,169 +958,736 @@ class PSDView(BaseView):
         Args:
             error_msg: The error message to display.
         """
-        if not hasattr(self, 'canvas') or not self.canvas:
+        if self.canvas is None:
             return
             
-        self.canvas.delete("all")
+        self.canvas.delete("loading_text", "error_text")
+        if self.image_on_canvas is not None:
+            self.canvas.itemconfig(self.image_on_canvas, state=tk.HIDDEN)
+        canvas_width, canvas_height = self._canvas_wh
         self.canvas.create_text(
-            self.canvas.winfo_width() // 2,
-            self.canvas.winfo_height() // 2,
+            canvas_width // 2,
+            canvas_height // 2,
             text=f"Error: {error_msg}",
             font=('Arial', 12),
             fill='red',
             tags=("error_text",),
-            width=self.canvas.winfo_width() - 40
+            width=canvas_width - 40
         )
 
     def _update_canvas(self) -> None:
         """Update the canvas with the current PSD image.
         
-        This method renders the current state of the PSD document to the canvas,
-        handling scaling and display updates. It shows a loading indicator while
-        processing and updates the scroll region to match the image dimensions.
+        The composite is generated and scaled on the render worker so the Tk
+        event loop stays responsive; only the finished pixels are handed
+        back to the main thread by ``_on_render_done``. A newer request
+        supersedes any render that is still pending.
         
         Raises:
             RuntimeError: If the canvas is not properly initialized.
         """
+        if self.canvas is None:
+            error_msg = "Canvas not initialized"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+            
+        if not self.psd_doc or not hasattr(self.psd_doc, 'get_composite_image'):
+            self._show_error_indicator("No PSD document loaded")
+            return
+            
+        if not self._canvas_ready():
+            return
+            
+        # Only reached before a composite exists; zooming an existing one
+        # goes through _rescale
+        self._show_loading_indicator("Rendering PSD...")
+        self._submit_render(functools.partial(
+            self._composite_and_scale, self.psd_doc.get_composite_image, self._view_state()
+        ))
+
+    def _invalidate_composite(self) -> None:
+        """Forget the cached composite and everything derived from it."""
+        self._cancel_render()
+        self._composite_pending = False
+        self._cleanup_photo_image()
+        self._zoom_anchor = None
+        self._current_image = None
+        self._prepared = None
+        self._scale_source = None
+        self._scale_cache.clear()
+        self._pyramid = []
+        self._scratch.clear()
+        self._current_composite_scale = None
+
+    def _submit_render(self, render: Callable[[Callable[[], bool]], Optional[ScaledView]]) -> None:
+        """Run a render on the worker and install its result on the Tk thread.
+        
+        Args:
+            render: Produces the view to display; must not touch Tk. It is
+                passed a callable that reports whether a newer render has
+                been requested since, so it can stop between stages.
+        """
+        self._cancel_render()
+        generation = self._render_generation
+        
+        future = self._render_pool.submit(
+            render, lambda: generation != self._render_generation
+        )
+        self._pending_future = future
+        self._pending_scale = self.current_scale
+        future.add_done_callback(
+            lambda f: self.after(0, self._on_render_done, f)
+        )
+
+    def _cancel_render(self) -> None:
+        """Supersede the pending render, if any.
+        
+        A render that has not started is dropped; one that is already
+        running stops at its next stage boundary.
+        """
+        self._render_generation += 1
+        if self._pending_future is not None:
+            self._pending_future.cancel()
+            self._pending_future = None
+            self._pending_scale = None
+
+    def _composite_and_scale(self, get_composite: Callable[[], Optional[Image.Image]],
+                             view: Tuple[float, Tuple[int, int], Tuple[int, int]],
+                             is_stale: Callable[[], bool]) -> Optional[ScaledView]:
+        """Generate the composite and scale it for display.
+        
+        Runs on the render worker.
+        
+        Args:
+            get_composite: Returns the document composite.
+            view: The view state captured by ``_view_state``.
+            is_stale: Reports whether this render has been superseded.
+            
+        Returns:
+            Optional[ScaledView]: The scaled view, or None if no composite
+            could be generated or the render was superseded.
+        """
+        img = get_composite()
+        if not img or is_stale():
+            return None
+        return self._render_scaled(img, view, is_stale)
+
+    def _on_render_done(self, future: Future) -> None:
+        """Paint a finished background render onto the canvas.
+        
+        Runs on the Tk thread. Results from superseded or cancelled renders
+        are discarded.
+        
+        Args:
+            future: The future returned by the render worker.
+        """
+        if future is not self._pending_future or future.cancelled():
+            return
+        self._pending_future = None
+        self._pending_scale = None
+        
         try:
-            if not hasattr(self, 'canvas') or not self.canvas:
-                error_msg = "Canvas not initialized"
-                logger.error(error_msg)
-                raise RuntimeError(error_msg)
-                
-            if not self.psd_doc or not hasattr(self.psd_doc, 'get_composite_image'):
-                self._show_error_indicator("No PSD document loaded")
-                return
+            view = future.result()
+        except Exception as e:
+            self._zoom_anchor = None
+            error_msg = f"Error generating composite: {str(e)}"
+            logger.exception(error_msg)
+            self._show_error_indicator(error_msg)
+            self.show_status(error_msg, "error")
+            return
+            
+        if not view:
+            self._zoom_anchor = None
+            self._show_error_indicator("Failed to generate composite image")
+            return
+            
+        self._install_image(view)
+
+    def _show_composite(self, img: Image.Image) -> None:
+        """Show a newly loaded composite from the top-left corner.
+        
+        Preparing and scaling a full composite is slow, so it runs on the
+        render worker like any other render.
+        
+        Args:
+            img: The composite image.
+        """
+        if self.canvas is None:
+            return
+        self._current_image = img
+        self._zoom_anchor = None
+        self._reset_view()
+        self._show_loading_indicator("Rendering PSD...")
+        if self._canvas_ready():
+            self._submit_render(functools.partial(self._render_scaled, img, self._view_state()))
+
+    def _display_image(self, img: Image.Image) -> None:
+        """Show a composite image on the canvas.
+        
+        Args:
+            img: The PIL image to display.
+        """
+        if self.canvas is None:
+            return
+        self._install_image(self._render_scaled(img, self._view_state()))
+
+    def _canvas_ready(self) -> bool:
+        """Check that the canvas size is known before starting a render.
+        
+        Until the first ``<Configure>`` the cached size is unknown; Tk is
+        asked directly, and if the canvas is not laid out yet either, the
+        render is deferred to ``_do_configure``. Rendering against an
+        unknown size would resample the whole image at the current scale.
+        
+        Returns:
+            bool: True if a render can start now.
+        """
+        canvas_width, canvas_height = self._canvas_wh
+        if canvas_width <= 1 or canvas_height <= 1:
+            canvas_width = self.canvas.winfo_width()
+            canvas_height = self.canvas.winfo_height()
+            if canvas_width <= 1 or canvas_height <= 1:
+                self._render_deferred = True
+                return False
+            self._canvas_wh = (canvas_width, canvas_height)
+        return True
+
+    def _view_state(self) -> Tuple[float, Tuple[int, int], Tuple[int, int]]:
+        """Capture the view state a render needs, on the Tk thread.
+        
+        While a zoom is pending the scroll position is the one that keeps
+        the zoom anchor in place at the new scale; ``_install_image``
+        scrolls there once the render is shown.
+        
+        Returns:
+            Tuple: The display scale, the canvas size and the canvas scroll
+            position.
+        """
+        if self._zoom_anchor is not None and self._current_image is not None:
+            scroll = self._anchored_scroll(self.current_scale)
+        else:
+            scroll = (int(self.canvas.canvasx(0)), int(self.canvas.canvasy(0)))
+        return self.current_scale, self._canvas_wh, scroll
+
+    def _image_point(self, window_xy: Optional[Tuple[int, int]] = None
+                     ) -> Optional[Tuple[float, float, int, int]]:
+        """Locate a window position on the displayed image.
+        
+        Args:
+            window_xy: The position in canvas window pixels, or None for the
+                center of the canvas.
                 
-            # Show loading indicator
-            self._show_loading_indicator("Rendering PSD...")
+        Returns:
+            Optional[Tuple[float, float, int, int]]: The image point as
+            fractions of the image size, clamped to the image, followed by
+            the window position; None if no image is shown.
+        """
+        if self._img_wh == (0, 0):
+            return None
+        canvas_width, canvas_height = self._canvas_wh
+        if window_xy is None:
+            window_xy = (canvas_width // 2, canvas_height // 2)
+        window_x, window_y = window_xy
+        img_width, img_height = self._img_wh
+        offset_x = max(0, (canvas_width - img_width) // 2)
+        offset_y = max(0, (canvas_height - img_height) // 2)
+        fx = (self.canvas.canvasx(window_x) - offset_x) / img_width
+        fy = (self.canvas.canvasy(window_y) - offset_y) / img_height
+        return (min(max(fx, 0.0), 1.0), min(max(fy, 0.0), 1.0), window_x, window_y)
+
+    def _anchored_scroll(self, scale: float) -> Tuple[int, int]:
+        """Get the scroll position that keeps the zoom anchor in place.
+        
+        Args:
+            scale: The display scale being zoomed to.
             
-            # Get the composite image
-            img = self.psd_doc.get_composite_image()
-            if not img:
-                self._show_error_indicator("Failed to generate composite image")
-                return
+        Returns:
+            Tuple[int, int]: The canvas scroll position, limited to what the
+            scroll region at ``scale`` allows.
+        """
+        fx, fy, window_x, window_y = self._zoom_anchor
+        img_wh = self._scaled_size(self._current_image, scale)
+        left, top, right, bottom = self._scroll_region(img_wh)
+        canvas_width, canvas_height = self._canvas_wh
+        offset_x = max(0, (canvas_width - img_wh[0]) // 2)
+        offset_y = max(0, (canvas_height - img_wh[1]) // 2)
+        x = round(offset_x + fx * img_wh[0] - window_x)
+        y = round(offset_y + fy * img_wh[1] - window_y)
+        return (min(max(x, left), max(left, right - canvas_width)),
+                min(max(y, top), max(top, bottom - canvas_height)))
+
+    def _scroll_to(self, scroll: Tuple[int, int]) -> None:
+        """Scroll the canvas so that a canvas position is at the top-left.
+        
+        Args:
+            scroll: The canvas position, within the current scroll region.
+        """
+        if self._last_scrollregion is None:
+            return
+        left, top, right, bottom = self._last_scrollregion
+        self.canvas.xview_moveto((scroll[0] - left) / (right - left))
+        self.canvas.yview_moveto((scroll[1] - top) / (bottom - top))
+
+    def _render_scaled(self, img: Image.Image,
+                       view: Tuple[float, Tuple[int, int], Tuple[int, int]],
+                       is_stale: Optional[Callable[[], bool]] = None) -> Optional[ScaledView]:
+        """Scale a composite for display.
+        
+        Does not touch Tk, so it can run on the render worker. Past the
+        canvas size only the visible part is resampled.
+        
+        Args:
+            img: The composite image.
+            view: The view state captured by ``_view_state``.
+            is_stale: Reports whether this render has been superseded; it
+                is checked before the resample.
             
-            # Convert to PhotoImage
-            try:
-                self.photo_image = ImageTk.PhotoImage(image=img)
-            except Exception as photo_error:
-                error_msg = f"Error creating image preview: {photo_error}"
-                logger.exception(error_msg)
-                self._show_error_indicator(error_msg)
-                return
+        Returns:
+            Optional[ScaledView]: The pixels to display and where they
+            belong, or None if the render was superseded.
+        """
+        scale, canvas_wh, scroll = view
+        prepared = self._prepare_for_display(img)
+        if is_stale is not None and is_stale():
+            return None
+        size = self._scaled_size(prepared, scale)
+        box = self._visible_box(size, scale, canvas_wh, scroll)
+        if box is None:
+            return ScaledView(img, self._display_scale(prepared, scale), size, None,
+                              scale, canvas_wh, scroll)
+        return ScaledView(img, self._render_viewport(prepared, size, box), size, box[:2],
+                          scale, canvas_wh, scroll)
+
+    def _install_image(self, view: ScaledView) -> None:
+        """Show a scaled view on the canvas.
+        
+        Args:
+            view: The view produced by ``_render_scaled``.
+        """
+        if self.canvas is None:
+            return
             
-            # Clear canvas and display the image
-            self.canvas.delete("all")
-            try:
+        self._current_image = view.source
+        self._img_wh = view.size
+        try:
+            self._blit(view.image)
+            self._view_origin = view.origin
+            self._current_composite_scale = view.scale
+            # The photo holds a copy, so the viewport buffer can be reused
+            if view.origin is not None:
+                self._scratch.append(view.image)
+        except Exception as photo_error:
+            error_msg = f"Error creating image preview: {photo_error}"
+            logger.exception(error_msg)
+            self._show_error_indicator(error_msg)
+            return
+        
+        # Keep a single image item and point it at the (possibly reallocated)
+        # photo rather than rebuilding the canvas display list
+        self.canvas.delete("loading_text", "error_text")
+        try:
+            if self.image_on_canvas is None:
                 self.image_on_canvas = self.canvas.create_image(
                     0, 0, 
                     anchor=tk.NW, 
-                    image=self.photo_image,
+                    image=self._photo_image,
                     tags=("psd_image",)
                 )
-                
-                # Update scroll region and center the image
-                self._update_scroll_region()
-                self._center_image()
-                
-            except Exception as canvas_error:
-                error_msg = f"Error updating canvas: {canvas_error}"
-                logger.exception(error_msg)
-                self._show_error_indicator(error_msg)
+            else:
+                self.canvas.itemconfig(self.image_on_canvas,
+                                       image=self._photo_image, state=tk.NORMAL)
             
-        except Exception as e:
-            error_msg = f"Unexpected error updating canvas: {str(e)}"
+        except tk.TclError as canvas_error:
+            error_msg = f"Error updating canvas: {canvas_error}"
             logger.exception(error_msg)
             self._show_error_indicator(error_msg)
-            self.show_status(error_msg, "error")
+            return
+            
+        # Update scroll region and center the image
+        self._apply_layout()
+        
+        # Bring the zoom anchor back under its window position
+        if self._zoom_anchor is not None and view.scale == self.current_scale:
+            self._zoom_anchor = None
+            self._scroll_to(view.scroll)
+        
+        # Tk may have clamped the scroll position to the new scroll region,
+        # and the view may have moved or been resized during the render
+        if view.origin is not None:
+            _, canvas_wh, scroll = self._view_state()
+            if scroll != view.scroll or canvas_wh != view.canvas_wh:
+                self._schedule_view_render()
+
+    def _make_blit(self, img: Image.Image) -> Callable[[Image.Image], None]:
+        """Build the blit routine for a prepared composite.
+        
+        Args:
+            img: The composite in its display mode.
+            
+        Returns:
+            Callable: ``_blit_photo`` with the composite's mode bound.
+        """
+        return functools.partial(self._blit_photo, mode=img.mode)
 
-    def _update_scroll_region(self) -> None:
-        """Update the scroll region to include the entire image with padding.
+    def _blit_photo(self, img: Image.Image, mode: str) -> None:
+        """Copy an image into the shared PhotoImage.
         
-        This ensures that the entire image is scrollable, with some extra
-        padding around the edges for better user experience.
+        A single PhotoImage is kept and grown to the largest size seen so
+        far; images that fit are pasted into it instead of allocating a new
+        Tk pixmap on every redraw. It is reallocated at the image size when
+        it has become much larger than the images shown in it
+        (``PHOTO_SLACK_FACTOR``), and dropped with the composite.
         
-        Raises:
-            RuntimeError: If required attributes are not initialized.
+        Args:
+            img: The image to show, already in ``mode``.
+            mode: The mode of the current composite.
         """
-        if not hasattr(self, 'canvas') or not self.canvas:
-            error_msg = "Canvas not initialized"
-            logger.error(error_msg)
-            raise RuntimeError(error_msg)
+        width, height = img.size
+        cap_width, cap_height = self._pi_capacity
+        slack = self.PHOTO_SLACK_FACTOR * width * height
+        if (self._photo_image is not None and mode == self._pi_mode
+                and width <= cap_width and height <= cap_height
+                and cap_width * cap_height <= slack):
+            shown_width, shown_height = self._pi_shown
+            if width < shown_width or height < shown_height:
+                # Clear pixels the previous image left outside this one
+                self.canvas.tk.call(str(self._photo_image), 'blank')
+        else:
+            capacity = (max(width, cap_width), max(height, cap_height))
+            if capacity[0] * capacity[1] > slack:
+                capacity = (width, height)
+            self._pi_capacity = capacity
+            self._pi_mode = mode
+            self._photo_image = ImageTk.PhotoImage(mode, capacity)
+        self._photo_image.paste(img)
+        self._pi_shown = (width, height)
+
+    def _prepare_for_display(self, img: Image.Image) -> Image.Image:
+        """Convert a composite to a mode Tk can take directly.
+        
+        ``ImageTk.PhotoImage.paste`` converts any other mode on every call,
+        so the conversion is done once and cached for the source image.
+        Fully opaque RGBA images are reduced to RGB, which saves a byte per
+        pixel and spares Tk the alpha blending. The blit routine for the
+        resulting mode is chosen here, once per composite.
+        
+        Args:
+            img: The composite image.
             
-        if not hasattr(self, 'image_on_canvas') or not self._photo_image:
-            logger.debug("No image to update scroll region for")
-            return
+        Returns:
+            Image.Image: The image in a Tk-native mode.
+        """
+        if self._prepared is not None and self._prepared[0] is img:
+            return self._prepared[1]
+            
+        prepared = img
+        if img.mode not in self._TK_NATIVE_MODES:
+            has_alpha = 'A' in img.getbands() or 'transparency' in img.info
+            prepared = img.convert('RGBA' if has_alpha else 'RGB')
+            
+        if prepared.mode == 'RGBA':
+            alpha_min, _ = prepared.getchannel('A').getextrema()
+            if alpha_min == 255:
+                prepared = prepared.convert('RGB')
+            
+        self._prepared = (img, prepared)
+        self._blit = self._make_blit(prepared)
+        return prepared
+
+    def _display_scale(self, img: Image.Image, scale: float) -> Image.Image:
+        """Resize an image to the current display scale.
+        
+        Downscales start from the smallest mipmap level that is still at
+        least the target size (see ``_pyramid_level``) and resize the small
+        remainder with ``RESAMPLE_FILTER``. Scales are quantized to whole
+        percent so that nearly identical requests share an entry in a small
+        LRU cache of scaled images.
+        
+        Args:
+            img: The full-resolution image.
+            scale: The display scale.
             
+        Returns:
+            Image.Image: The image to display.
+        """
+        percent = max(1, round(scale * 100))
+        if percent == 100:
+            return img
+            
+        if self._scale_source is not img:
+            self._scale_source = img
+            self._scale_cache.clear()
+            
+        scaled = self._scale_cache.get(percent)
+        if scaled is not None:
+            self._scale_cache.move_to_end(percent)
+            return scaled
+            
+        target = self._scaled_size(img, scale)
+        scaled = self._pyramid_level(img, target)
+        if scaled.size != target:
+            scaled = self._resample(scaled, target)
+            
+        self._scale_cache[percent] = scaled
+        if len(self._scale_cache) > self.SCALE_CACHE_SIZE:
+            self._scale_cache.popitem(last=False)
+        return scaled
+
+    def _scaled_size(self, img: Image.Image, scale: float) -> Tuple[int, int]:
+        """Get the size of an image at a display scale.
+        
+        Args:
+            img: The full-resolution image.
+            scale: The display scale, quantized to whole percent.
+            
+        Returns:
+            Tuple[int, int]: The scaled width and height.
+        """
+        scale = max(1, round(scale * 100)) / 100
+        return (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+
+    def _visible_box(self, img_wh: Tuple[int, int], scale: float,
+                     canvas_wh: Tuple[int, int], scroll: Tuple[int, int]) -> Optional[Tuple[int, int, int, int]]:
+        """Get the visible part of the scaled image.
+        
+        Args:
+            img_wh: The size of the whole scaled image.
+            scale: The display scale.
+            canvas_wh: The canvas size.
+            scroll: The canvas scroll position.
+            
+        Returns:
+            Optional[Tuple[int, int, int, int]]: The visible box in scaled
+            image coordinates, or None when the whole image should be
+            rendered (it fits the canvas, or is shown at 100%).
+        """
+        canvas_width, canvas_height = canvas_wh
+        img_width, img_height = img_wh
+        if (round(scale * 100) == 100
+                or (img_width <= canvas_width and img_height <= canvas_height)):
+            return None
+            
+        # Offset of the image origin on the canvas, as in _center_image
+        offset_x = max(0, (canvas_width - img_width) // 2)
+        offset_y = max(0, (canvas_height - img_height) // 2)
+        left = scroll[0] - offset_x
+        top = scroll[1] - offset_y
+        
+        x1 = min(max(0, left), img_width - 1)
+        y1 = min(max(0, top), img_height - 1)
+        x2 = max(x1 + 1, min(left + canvas_width, img_width))
+        y2 = max(y1 + 1, min(top + canvas_height, img_height))
+        return (x1, y1, x2, y2)
+
+    def _render_viewport(self, img: Image.Image, size: Tuple[int, int],
+                         box: Tuple[int, int, int, int]) -> Image.Image:
+        """Resample only the visible part of an image.
+        
+        ``Image.resize`` takes the source region directly, so the crop is
+        never materialized and the cost scales with the canvas size rather
+        than the document size.
+        
+        Args:
+            img: The full-resolution image.
+            size: The size of the whole scaled image.
+            box: The visible box in scaled image coordinates.
+            
+        Returns:
+            Image.Image: The visible part at the current display scale.
+        """
+        x1, y1, x2, y2 = box
+        if size == img.size:
+            # Nothing to resample at 100%
+            return img.crop(box)
+        img = self._pyramid_level(img, size)
+        scale_x = size[0] / img.width
+        scale_y = size[1] / img.height
+        source_box = (x1 / scale_x, y1 / scale_y,
+                      min(img.width, x2 / scale_x), min(img.height, y2 / scale_y))
+        # Take the scratch image so a concurrent blit never sees it rewritten
         try:
-            # Get image dimensions
-            img_width = self._photo_image.width()
-            img_height = self._photo_image.height()
-            
-            # Add padding around the image
-            padding = 20
-            
-            # Update scroll region to include the full image with padding
-            self.canvas.config(
-                scrollregion=(
-                    -padding,
-                    -padding,
-                    img_width + padding * 2,  # Double padding for width
-                    img_height + padding * 2   # Double padding for height
-                )
-            )
+            out = self._scratch.pop()
+        except IndexError:
+            out = None
+        return self._resample(img, (x2 - x1, y2 - y1), source_box, out)
+
+    def _resample(self, img: Image.Image, size: Tuple[int, int],
+                  box: Optional[Tuple[float, float, float, float]] = None,
+                  out: Optional[Image.Image] = None) -> Image.Image:
+        """Resize an image, or a region of it, with ``RESAMPLE_FILTER``.
+        
+        8-bit RGB and RGBA images go through cykooz.resizer when it is
+        installed; everything else uses ``Image.resize`` with
+        ``REDUCING_GAP``. Most downscales start from a mipmap level within
+        2x of the target, where the gap has no effect; it pays off for
+        targets below the smallest level.
+        
+        Args:
+            img: The source image.
+            size: The output size.
+            box: The source region to resize, or None for the whole image.
+            out: An image to resize into when it matches the output mode and
+                size. Only cykooz.resizer can write into an existing image.
             
-            # Reset the view to show the top-left corner
-            self.canvas.xview_moveto(0.0)
-            self.canvas.yview_moveto(0.0)
+        Returns:
+            Image.Image: The resized image.
+        """
+        if self._resizer is None or img.mode not in ('RGB', 'RGBA'):
+            return img.resize(size, self.RESAMPLE_FILTER, box=box,
+                              reducing_gap=self.REDUCING_GAP)
+            
+        crop_box = None
+        if box is not None:
+            left, top, right, bottom = box
+            crop_box = CropBox(left, top, right - left, bottom - top)
+        if out is not None and out.mode == img.mode and out.size == size:
+            resized = out
+        else:
+            resized = Image.new(img.mode, size)
+        self._resizer.resize_pil(
+            img, resized, ResizeOptions(resize_alg=self._resize_alg, crop_box=crop_box)
+        )
+        return resized
+
+    def _schedule_view_render(self) -> None:
+        """Re-render the visible part of the image after the view moved.
+        
+        Only applies when a viewport is shown; scroll bursts are coalesced
+        into one render per ``render_delay_ms``.
+        """
+        if self._view_origin is None or self._view_after_id is not None:
+            return
+        self._view_after_id = self.after(
+            self._zoom_settings.render_delay_ms, self._render_view
+        )
+
+    def _render_view(self) -> None:
+        """Render the viewport for the current scroll position.
+        
+        A render that is still pending re-checks the scroll position and
+        canvas size when it is installed, so nothing is queued behind it.
+        """
+        self._view_after_id = None
+        if (self._current_image is None or self._view_origin is None
+                or self._pending_future is not None):
+            return
+        self._submit_render(functools.partial(
+            self._render_scaled, self._current_image, self._view_state()
+        ))
+
+    def _pyramid_level(self, img: Image.Image, target: Tuple[int, int]) -> Image.Image:
+        """Get the smallest mipmap level that still covers a target size.
+        
+        The pyramid is built once per composite by repeated halving with
+        LANCZOS, so any zoom level below 100% only needs a resize by a
+        factor between 1 and 2 at render time.
+        
+        Args:
+            img: The full-resolution image.
+            target: The size the image will be displayed at.
             
-        except Exception as e:
-            error_msg = f"Error updating scroll region: {str(e)}"
-            logger.exception(error_msg)
-            self.show_status(error_msg, "error")
+        Returns:
+            Image.Image: A pyramid level at least as large as ``target``.
+        """
+        if target[0] >= img.width or target[1] >= img.height:
+            return img
+            
+        if not self._pyramid or self._pyramid[0] is not img:
+            self._pyramid = [img]
+            level = img
+            while min(level.size) // 2 >= self.PYRAMID_MIN_SIZE:
+                level = level.resize((level.width // 2, level.height // 2), Image.LANCZOS)
+                self._pyramid.append(level)
+                
+        best = img
+        for level in self._pyramid[1:]:
+            if level.width < target[0] or level.height < target[1]:
+                break
+            best = level
+        return best
+
+    def _reset_view(self) -> None:
+        """Scroll the view back to the top-left corner of the image.
+        
+        Only called when a document is loaded or fitted to the window, so
+        ordinary redraws keep the user's scroll position.
+        """
+        if self.canvas is None:
+            return
+        self.canvas.xview_moveto(0.0)
+        self.canvas.yview_moveto(0.0)
 
     def _center_image(self) -> None:
-        """Center the image in the scrollable area.
+        """Center the image in the scrollable area."""
+        self._apply_layout()
+
+    def _scroll_region(self, img_wh: Tuple[int, int]) -> Tuple[int, int, int, int]:
+        """Get the scroll region for a scaled image.
+        
+        Args:
+            img_wh: The size of the whole scaled image.
+            
+        Returns:
+            Tuple[int, int, int, int]: The image bounds with some padding.
+        """
+        img_width, img_height = img_wh
+        padding = 20
+        return (
+            -padding,
+            -padding,
+            img_width + padding * 2,  # Double padding for width
+            img_height + padding * 2   # Double padding for height
+        )
+
+    def _apply_layout(self) -> None:
+        """Position the image and size the scroll region around it.
         
-        This method positions the image in the center of the visible canvas area
-        and updates the scroll region to ensure the entire image is accessible.
+        The image is centered when it is smaller than the canvas, and the
+        scroll region covers the whole scaled image with some padding.
+        Nothing is sent to Tk when none of the inputs changed since the last
+        call, and the scroll region is only reconfigured when it changes.
         
         Raises:
             RuntimeError: If required attributes are not initialized.
         """
-        if not hasattr(self, 'canvas') or not self.canvas:
+        if self.canvas is None:
             error_msg = "Canvas not initialized"
             logger.error(error_msg)
             raise RuntimeError(error_msg)
             
-        if not hasattr(self, 'image_on_canvas') or not self._photo_image:
-            logger.debug("No image to center")
+        if self._img_wh == (0, 0):
+            logger.debug("No image to lay out")
             return
             
-        try:
-            # Get current canvas dimensions
-            canvas_width = self.canvas.winfo_width()
-            canvas_height = self.canvas.winfo_height()
-            
-            # Get image dimensions
-            img_width = self._photo_image.width()
-            img_height = self._photo_image.height()
-            
-            # Calculate center position with bounds checking
-            x = max(0, (canvas_width - img_width) // 2)
-            y = max(0, (canvas_height - img_height) // 2)
-            
-            # Position the image
-            self.canvas.coords(self.image_on_canvas, x, y)
-            
-            # Update scroll region to ensure all of the image is accessible
-            self._update_scroll_region()
+        layout = (self._canvas_wh, self._img_wh, self._view_origin, self.image_on_canvas)
+        if layout == self._last_layout:
+            return
             
-        except Exception as e:
-            error_msg = f"Error centering image: {str(e)}"
+        canvas_width, canvas_height = self._canvas_wh
+        img_width, img_height = self._img_wh
+        scrollregion = self._scroll_region(self._img_wh)
+        
+        # Calculate center position with bounds checking
+        x = max(0, (canvas_width - img_width) // 2)
+        y = max(0, (canvas_height - img_height) // 2)
+        
+        # A viewport sits at its offset within the full image
+        if self._view_origin is not None:
+            x += self._view_origin[0]
+            y += self._view_origin[1]
+        
+        try:
+            if scrollregion != self._last_scrollregion:
+                self.canvas.configure(scrollregion=scrollregion)
+                self._last_scrollregion = scrollregion
+            if self.image_on_canvas is not None:
+                self.canvas.coords(self.image_on_canvas, x, y)
+        except tk.TclError as e:
+            error_msg = f"Error updating layout: {str(e)}"
             logger.exception(error_msg)
             self.show_status(error_msg, "error")
+            return
+        self._last_layout = layout
 
     def show_status(self, message: str, msg_type: Union[str, MessageType] = "info", duration: int = 5000) -> None:
         """Show a status message in the status bar.
@@ -903,79 +1709,293 @@ class PSDView(BaseView):
         Note:
             If the status bar is not initialized, this method will do nothing.
         """
-        if not hasattr(self, 'status_var') or not hasattr(self, 'status_bar'):
+        if self.status_var is None or self.status_bar is None:
             logger.warning("Status bar not initialized, cannot show message")
             return
             
-        try:
-            # Set the message text
-            self.status_var.set(str(message))
-            
-            # Set the foreground color based on message type
-            colors = {
-                MessageType.INFO: 'black',
-                MessageType.SUCCESS: '#006400',     # Dark green
-                MessageType.WARNING: '#8B4513',     # Saddle brown
-                MessageType.ERROR: '#8B0000'        # Dark red
-            }
-            
-            # Apply styling
-            fg_color = colors.get(msg_type, 'black')
-            self.status_bar.config(foreground=fg_color)
-            
-            # Set font weight based on message type
-            font = ('TkDefaultFont', 9)
-            if msg_type in (MessageType.WARNING, MessageType.ERROR):
-                font = ('TkDefaultFont', 9, 'bold')
+        # Convert string to MessageType if needed
+        if isinstance(msg_type, str):
+            msg_type = MessageType.from_string(msg_type)
+            
+        # A message that is already shown only restarts its clear timer
+        status = (str(message), msg_type)
+        repeated = status == self._last_status
+        if not repeated:
+            try:
+                # Set the message text
+                self.status_var.set(status[0])
                 
-            self.status_bar.config(font=font)
-            
-            # Clear any existing timer
-            if hasattr(self, '_status_timer') and self._status_timer is not None:
-                try:
-                    self.after_cancel(self._status_timer)
-                except (ValueError, tk.TclError):
-                    # Timer ID was invalid or already canceled
-                    pass
-            
-            # Set a timer to clear the message if duration is positive
-            if duration > 0:
-                try:
-                    self._status_timer = self.after(
-                        duration,
-                        self.clear_status
-                    )
-                except tk.TclError as e:
-                    logger.error(f"Failed to set status timer: {e}")
-                    
-            # Log the status message
-            log_levels = {
-                'info': logging.INFO,
-                'success': logging.INFO,
-                'warning': logging.WARNING,
-                'error': logging.ERROR
-            }
-            # Convert string to MessageType if needed
-            if isinstance(msg_type, str):
-                msg_type = MessageType.from_string(msg_type)
-            log_level = log_levels.get(msg_type.value, logging.INFO)
-            logger.log(log_level, f"Status: {message}")
+                # Apply color and font weight based on message type, skipping
+                # the reconfigure when the style is unchanged
+                style = (
+                    self._STATUS_COLORS.get(msg_type, 'black'),
+                    self._font_bold if msg_type in self._BOLD_STATUS_TYPES else self._font_normal
+                )
+                if style != self._last_status_style:
+                    fg_color, font = style
+                    self.status_bar.config(foreground=fg_color, font=font)
+                    self._last_status_style = style
+            except tk.TclError as e:
+                logger.exception("Error showing status message: %s", e)
+                return
+            self._last_status = status
+        
+        # Clear any existing timer
+        if self._status_timer is not None:
+            try:
+                self.after_cancel(self._status_timer)
+            except (ValueError, tk.TclError):
+                # Timer ID was invalid or already canceled
+                pass
+        
+        # Set a timer to clear the message if duration is positive
+        if duration > 0:
+            try:
+                self._status_timer = self.after(
+                    duration,
+                    self.clear_status
+                )
+            except tk.TclError as e:
+                logger.error("Failed to set status timer: %s", e)
+                
+        # Log the status message
+        log_level = self._LOG_LEVELS.get(msg_type, logging.INFO)
+        if not repeated and logger.isEnabledFor(log_level):
+            logger.log(log_level, "Status: %s", message)
+
+    def zoom(self, factor: float, anchor: Optional[Tuple[int, int]] = None) -> None:
+        """Zoom the view by the given factor.
+        
+        The scale is updated immediately, but the redraw is debounced: each
+        step restarts a ``zoom_debounce_ms`` timer, so a mouse-wheel or
+        key-repeat burst of N steps renders only the final scale, once.
+        
+        Args:
+            factor: Zoom factor (e.g., 1.2 for 20% zoom in, 0.8 for 20% zoom out)
+            anchor: The window position that stays on the same image point,
+                or None for the center of the canvas.
+        """
+        if self.canvas is None or not self.psd_doc:
+            return
             
-        except Exception as e:
-            logger.exception(f"Error showing status message: {e}")
+        self._zoom_to(self.current_scale * factor, anchor)
+    
+    def _zoom_to(self, scale: float, anchor: Optional[Tuple[int, int]] = None) -> None:
+        """Set the zoom level and schedule the debounced redraw.
+        
+        The image point under ``anchor`` is recorded at the first step of a
+        burst, while the displayed image still matches it, and is kept
+        there when the new scale is shown.
+        
+        Args:
+            scale: The new scale; clamped to the configured limits.
+            anchor: The window position to zoom around, or None for the
+                center of the canvas.
+        """
+        settings = self._zoom_settings
+        old_scale = self.current_scale
+        new_scale = max(settings.min_scale, min(scale, settings.max_scale))
+        if new_scale == old_scale:
+            # Already at the zoom limit
+            return
+        if self._zoom_anchor is None:
+            self._zoom_anchor = self._image_point(anchor)
+        self.current_scale = new_scale
+        
+        if self._zoom_after_id is not None:
+            self.after_cancel(self._zoom_after_id)
+        self._zoom_after_id = self.after(settings.zoom_debounce_ms, self._flush_zoom)
+    
+    def _flush_zoom(self) -> None:
+        """Render the accumulated zoom level."""
+        self._zoom_after_id = None
+        if self._current_composite_scale == self.current_scale:
+            # Zoomed back to the displayed scale: the view has not moved,
+            # and a render for a scale in between must not land
+            if self._pending_scale != self.current_scale:
+                self._cancel_render()
+                self.canvas.delete("loading_text")
+            self._zoom_anchor = None
+            return
+        self._rescale()
+        self.show_status(f"Zoom: {round(self.current_scale * 100)}%")
+    
+    def zoom_in(self, event: Optional[tk.Event] = None,
+                anchor: Optional[Tuple[int, int]] = None) -> None:
+        """Zoom in to the next step of the zoom ladder.
+        
+        Args:
+            event: The triggering event, if any.
+            anchor: The window position to zoom around, or None for the
+                center of the canvas.
+        """
+        if self.canvas is None or not self.psd_doc:
+            return
+        self._zoom_to(self._ladder_scale(1), anchor)
+    
+    def zoom_out(self, event: Optional[tk.Event] = None,
+                 anchor: Optional[Tuple[int, int]] = None) -> None:
+        """Zoom out to the previous step of the zoom ladder.
+        
+        Args:
+            event: The triggering event, if any.
+            anchor: The window position to zoom around, or None for the
+                center of the canvas.
+        """
+        if self.canvas is None or not self.psd_doc:
+            return
+        self._zoom_to(self._ladder_scale(-1), anchor)
+    
+    def _ladder_scale(self, direction: int) -> float:
+        """Get the neighbouring scale on the zoom ladder.
+        
+        The ladder is ``2 ** (n / steps_per_octave)``, so stepping always
+        lands on the same scales and the percent-keyed scale cache is hit
+        when zooming back and forth. A scale between rungs, such as a fit
+        to the window, steps to the nearest rung in the given direction.
+        
+        Args:
+            direction: 1 to zoom in, -1 to zoom out.
+            
+        Returns:
+            float: The scale of the next rung.
+        """
+        steps = self._zoom_settings.steps_per_octave
+        position = math.log2(self.current_scale) * steps
+        # Tolerate float error on scales that are already on a rung
+        if direction > 0:
+            rung = math.floor(position + 1e-6) + 1
+        else:
+            rung = math.ceil(position - 1e-6) - 1
+        return 2.0 ** (rung / steps)
+    
+    def zoom_100(self, event: Optional[tk.Event] = None) -> None:
+        """Show the image at its actual size, around the canvas center."""
+        if self.canvas is None or not self.psd_doc:
+            return
+        if self._zoom_anchor is None and self.current_scale != 1.0:
+            self._zoom_anchor = self._image_point()
+        self.current_scale = 1.0
+        self._rescale()
+        self.show_status("Zoom: 100%")
+    
+    def zoom_fit(self, event: Optional[tk.Event] = None) -> None:
+        """Zoom out so that the whole image fits the canvas."""
+        if self.canvas is None or not self.psd_doc:
+            return
+            
+        if self._prepared is not None:
+            width, height = self._prepared[1].size
+        else:
+            width, height = self.psd_doc.width, self.psd_doc.height
+        canvas_width, canvas_height = self._canvas_wh
+        if not width or not height or canvas_width <= 1 or canvas_height <= 1:
+            return
+            
+        # Round down to whole percent so the fitted image never overflows.
+        # Like Image.thumbnail, never enlarge: an image that already fits is
+        # shown at 100%, which needs no resample at all.
+        settings = self._zoom_settings
+        self._zoom_anchor = None
+        fit_percent = min(100, int(min(canvas_width / width, canvas_height / height) * 100))
+        self.current_scale = max(settings.min_scale, fit_percent / 100)
+        self._rescale()
+        self._reset_view()
+        self.show_status(f"Zoom: {round(self.current_scale * 100)}%")
+    
+    def _rescale(self) -> None:
+        """Redisplay the current composite at ``current_scale``.
+        
+        Zooming does not change the composite, so it is not regenerated.
+        When no resample is needed (100%, or a whole-image render that is
+        already in the scale cache) and the composite has been prepared for
+        display, the image is swapped in immediately; otherwise the render
+        runs on the render worker.
+        """
+        if self._zoom_after_id is not None:
+            self.after_cancel(self._zoom_after_id)
+            self._zoom_after_id = None
+            
+        source = self._current_image
+        if source is not None and not self._canvas_ready():
+            return
+        if source is None:
+            # A composite still being generated is shown at the current
+            # scale when it arrives; rendering now would composite twice
+            if not self._composite_pending:
+                self._update_canvas()
+            return
+            
+        # Until the worker has prepared this composite, even 100% needs the
+        # full-size conversion, which must not run on the Tk thread
+        percent = max(1, round(self.current_scale * 100))
+        prepared = self._prepared is not None and self._prepared[0] is source
+        cached = None
+        if prepared and self._scale_source is self._prepared[1]:
+            cached = self._scale_cache.get(percent)
+        canvas_width, canvas_height = self._canvas_wh
+        if prepared and (percent == 100 or (cached is not None and cached.width <= canvas_width
+                                            and cached.height <= canvas_height)):
+            # The scale cache and pyramid belong to the worker, which may
+            # still be running: 100% reads neither, and a cache hit is shown
+            # as is rather than through _display_scale
+            self._cancel_render()
+            if percent == 100:
+                self._display_image(source)
+            else:
+                scale, canvas_wh, scroll = self._view_state()
+                self._install_image(ScaledView(source, cached, cached.size, None,
+                                               scale, canvas_wh, scroll))
+            return
+            
+        if source.width * source.height > self.LOADING_INDICATOR_MIN_PIXELS:
+            self._show_loading_indicator("Rendering PSD...")
+        self._submit_render(functools.partial(
+            self._render_scaled, source, self._view_state()
+        ))
 
     def clear_status(self) -> None:
         """Clear the status bar."""
-        if hasattr(self, 'status_var'):
+        if self.status_var is not None:
             self.status_var.set('')
+        self._last_status = None
+
+    def reset_zoom(self, event: Optional[tk.Event] = None) -> None:
+        """Return to 100% zoom, scrolled to the top-left of the image."""
+        if not self.psd_doc or not self.canvas:
+            return
+        self._show_actual_size()
+        self.show_status("Zoom: 100%")
 
     def fit_to_window(self):
         """Center the PSD in the current window."""
         if not self.psd_doc or not self.canvas:
             return
-            
-        # Just center the image at 100% scale
-        self.current_scale = 1.0
-        self._update_canvas()
-        self._center_image()
+        self._show_actual_size()
         self.show_status("Image centered at 100%", MessageType.INFO)
+
+    def _show_actual_size(self) -> None:
+        """Show the image at 100% from the top-left corner.
+        
+        Renders only if the displayed image is at another scale; the render
+        lays the image out itself, so it is centered once either way. This
+        never composites: right after a load the composite is still being
+        generated, and it is shown at the current scale once it is ready.
+        """
+        if self._zoom_after_id is not None:
+            self.after_cancel(self._zoom_after_id)
+            self._zoom_after_id = None
+        self._zoom_anchor = None
+        self.current_scale = 1.0
+        # A render in flight at this scale lays the image out when it lands
+        in_flight = self._pending_future is not None and self._pending_scale == self.current_scale
+        if not in_flight:
+            if self._current_composite_scale == self.current_scale:
+                # Already rendered at this scale, only the position changes;
+                # a render at another scale must not replace it afterwards
+                self._cancel_render()
+                self.canvas.delete("loading_text")
+                self._center_image()
+            elif self._current_image is not None:
+                self._rescale()
+        self._reset_view()